@@ -1,4 +1,4 @@
-from flask import Flask, request, g, jsonify, make_response
+from flask import Flask, request, g, has_app_context, jsonify, make_response
 from flask_cors import CORS
 import uuid
 import json
@@ -6,7 +6,10 @@ import logging
 
 from .config import Config
 from .logger import make_logger
+from .json_provider import OrjsonProvider
 from .middleware import register_error_handlers
+from .oauth import start_code_cache_sweeper
+from .stores import start_burn_worker
 
 
 def create_app(config: Config = None) -> Flask:
@@ -23,6 +26,9 @@ def create_app(config: Config = None) -> Flask:
         SESSION_COOKIE_DOMAIN=cfg.SESSION_COOKIE_DOMAIN
     )
 
+    # Fast JSON encoding/decoding for jsonify() and request.get_json()
+    app.json = OrjsonProvider(app)
+
     # Attach config + logger
     app.cfg = cfg
     logger = make_logger(logfile=cfg.LOG_FILE)
@@ -45,7 +51,8 @@ def create_app(config: Config = None) -> Flask:
     # Add request-id filter to logger
     class ReqIdFilter(logging.Filter):
         def filter(self, rec):
-            rec.req_id = getattr(g, "request_id", "-")
+            # Background threads (burn worker, cache sweeper) have no g
+            rec.req_id = getattr(g, "request_id", "-") if has_app_context() else "-"
             return True
 
     req_filter = ReqIdFilter()
@@ -70,4 +77,10 @@ def create_app(config: Config = None) -> Flask:
     app.register_blueprint(health_bp)
     app.register_blueprint(oauth_bp)           # <-- ADDED
 
+    # Evict stale OAuth exchange results in the background
+    start_code_cache_sweeper()
+
+    # Revoke expired keys found during validation off the request thread
+    start_burn_worker(app.logger_custom)
+
     return app
\ No newline at end of file
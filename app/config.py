@@ -16,7 +16,7 @@ class Config:
         self.DISCORD_API_BASE = os.getenv("DISCORD_API_BASE", "https://discord.com/api")
 
         # Admins
-        self.ADMIN_USER_IDS = self._parse_int_list(os.getenv("ADMIN_USER_IDS", ""))
+        self.ADMIN_USER_IDS = frozenset(self._parse_int_list(os.getenv("ADMIN_USER_IDS", "")))
 
         # Feature flags
         self.ALLOW_CUSTOM_KEY = os.getenv("ALLOW_CUSTOM_KEY", "1") in ("1", "true", "True")
@@ -24,6 +24,7 @@ class Config:
         # Logging
         self.LOG_FILE = os.getenv("LOG_FILE", "")
         self.GUNICORN_WORKERS = int(os.getenv("GUNICORN_WORKERS", "2"))
+        self.GUNICORN_THREADS = int(os.getenv("GUNICORN_THREADS", "16"))
 
         # Session cookies
         self.SESSION_COOKIE_NAME = os.getenv("SESSION_COOKIE_NAME", "gamingmods_session")
@@ -1,5 +1,4 @@
 from flask import jsonify
-import json
 
 
 # -----------------------------
@@ -32,11 +31,11 @@ def register_exception_handlers(app):
 
     @app.errorhandler(ValidationError)
     def handle_validation(err):
-        app.logger_custom.warning(json.dumps({
+        app.logger_custom.warning("validation_error", extra={
             "event": "validation_error",
-            "message": str(err),
+            "error": str(err),
             "errors": getattr(err, "errors", [])
-        }))
+        })
         return jsonify({
             "ok": False,
             "error": "validation_error",
@@ -45,10 +44,10 @@ def register_exception_handlers(app):
 
     @app.errorhandler(AuthorizationError)
     def handle_auth(err):
-        app.logger_custom.warning(json.dumps({
+        app.logger_custom.warning("auth_error", extra={
             "event": "auth_error",
-            "message": str(err)
-        }))
+            "error": str(err)
+        })
         return jsonify({
             "ok": False,
             "error": "forbidden",
@@ -57,10 +56,10 @@ def register_exception_handlers(app):
 
     @app.errorhandler(NotFoundError)
     def handle_not_found(err):
-        app.logger_custom.warning(json.dumps({
+        app.logger_custom.warning("not_found", extra={
             "event": "not_found",
-            "message": str(err)
-        }))
+            "error": str(err)
+        })
         return jsonify({
             "ok": False,
             "error": "not_found",
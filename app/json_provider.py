@@ -0,0 +1,32 @@
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    Used by jsonify() and request.get_json(); types orjson does not
+    know natively fall back to Flask's default serializer.
+    """
+
+    # orjson output is always compact and keeps insertion order
+    compact = True
+    sort_keys = False
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=self.option).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response instead of
+        # decoding to str and letting Werkzeug encode it again
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(
+            obj,
+            default=self.default,
+            option=self.option | orjson.OPT_APPEND_NEWLINE
+        )
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -7,19 +7,35 @@ from datetime import datetime
 from .validators import validate_key_payload
 from .exceptions import ValidationError, AuthorizationError
 from .overrides import resolve_override
-from .stores import store_key_record, _store_lock, _KEYS_STORE
+from .stores import store_key_record, put_key
+from .utils.time_utils import now_iso
+
+
+# Allowed admin-supplied key strings
+_CUSTOM_KEY_RE = re.compile(r"[A-Za-z0-9_-]{4,64}")
 
 
 # -----------------------------
 # Random Key Generator
 # -----------------------------
 
+_KEY_ALPHABET = string.ascii_letters + string.digits
+
+
 def generate_random_key(length=10) -> str:
     """
     Generate a random alphanumeric key string of given length.
+    Draws all the entropy at once and spells it out in base 62.
     """
-    alphabet = string.ascii_letters + string.digits
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    base = len(_KEY_ALPHABET)
+    n = secrets.randbelow(base ** length)
+
+    chars = []
+    for _ in range(length):
+        n, i = divmod(n, base)
+        chars.append(_KEY_ALPHABET[i])
+
+    return ''.join(chars)
 
 
 # -----------------------------
@@ -50,22 +66,22 @@ def quick_key_create(app, payload: dict) -> dict:
         "role_id": override.role_id,
         "duration_minutes": duration,
         "applied_by_admin": override.applied_by_admin,
-        "created_at": datetime.utcnow().isoformat(),
+        "created_at": now_iso(),
         "status": "active",
     }
 
     # Always set expiry fields (default 24h)
-    record["expires_at"] = float(time.time() + 24 * 3600)
-    record["expiry_iso"] = datetime.utcfromtimestamp(record["expires_at"]).isoformat()
+    exp_ts = time.time() + 24 * 3600.0
+    record["expires_at"] = exp_ts
+    record["expiry_iso"] = datetime.utcfromtimestamp(exp_ts).isoformat()
 
     # Generate random key ID
     key_id = generate_random_key(10)
     record["key_id"] = key_id
 
-    with _store_lock:
-        _KEYS_STORE[key_id] = record
+    put_key(record)
 
-    app.logger_custom.info({
+    app.logger_custom.info("key.created", extra={
         "event": "key.created",
         "key_id": key_id,
         "type": "quick",
@@ -104,20 +120,21 @@ def custom_key_create(app, payload: dict) -> dict:
         "role_id": override.role_id,
         "duration_minutes": duration,
         "applied_by_admin": override.applied_by_admin,
-        "created_at": datetime.utcnow().isoformat(),
+        "created_at": now_iso(),
         "status": "active",
     }
 
     # Always set expiry fields (default 24h)
-    base_record["expires_at"] = float(time.time() + 24 * 3600)
-    base_record["expiry_iso"] = datetime.utcfromtimestamp(base_record["expires_at"]).isoformat()
+    exp_ts = time.time() + 24 * 3600.0
+    base_record["expires_at"] = exp_ts
+    base_record["expiry_iso"] = datetime.utcfromtimestamp(exp_ts).isoformat()
 
     # Admin custom key string
     if custom_key is not None:
         if not override.applied_by_admin:
             raise AuthorizationError("only admin may set custom key string")
 
-        if not re.match(r"^[A-Za-z0-9\-_]{4,64}$", custom_key):
+        if not _CUSTOM_KEY_RE.fullmatch(custom_key):
             raise ValidationError(
                 "custom_key_string invalid format; allowed A-Z a-z 0-9 - _ length 4-64"
             )
@@ -127,7 +144,7 @@ def custom_key_create(app, payload: dict) -> dict:
     else:
         stored = store_key_record(base_record)
 
-    app.logger_custom.info({
+    app.logger_custom.info("key.created", extra={
         "event": "key.created",
         "key_id": stored["key_id"],
         "type": "custom",
@@ -1,13 +1,62 @@
+import atexit
 import logging
 import json
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
 
 from .config import Config
 
 
+# Attributes every LogRecord has; anything else came in through extra=
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "req_id"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Renders each record as a single JSON object.
+    Fields passed via extra= are merged into the top level.
+    """
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "name": record.name,
+            "req_id": getattr(record, "req_id", "-"),
+            "msg": record.getMessage(),
+        }
+
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, default=str)
+
+
+class _LocalQueueHandler(QueueHandler):
+    """
+    Enqueues records untouched. The queue never leaves the process,
+    so the pickling prep (and formatting) QueueHandler does by
+    default is skipped; the listener thread formats instead.
+    """
+
+    def prepare(self, record):
+        return record
+
+
 def make_logger(name: str = "yt_discord_verifier", logfile: str = "") -> logging.Logger:
     """
     Creates a JSON‑formatted logger with optional rotating file output.
+    Request threads only enqueue records; a background listener
+    formats and writes them.
     """
     logger = logging.getLogger(name)
 
@@ -19,26 +68,26 @@ def make_logger(name: str = "yt_discord_verifier", logfile: str = "") -> logging
     logger.setLevel(logging.DEBUG if cfg.DEBUG else logging.INFO)
 
     # JSON log format
-    fmt = json.dumps({
-        "time": "%(asctime)s",
-        "level": "%(levelname)s",
-        "name": "%(name)s",
-        "req_id": "%(req_id)s",
-        "msg": "%(message)s"
-    })
-
-    formatter = logging.Formatter(fmt)
+    formatter = JsonFormatter()
 
     # Console output
     stream = logging.StreamHandler()
     stream.setFormatter(formatter)
-    logger.addHandler(stream)
+    handlers = [stream]
 
-    # Optional file logging
+    # Optional file logging (buffered; ERROR and above flush immediately)
     if logfile:
-        file_handler = RotatingFileHandler(logfile, maxBytes=10_000_000, backupCount=3)
+        file_handler = RotatingFileHandler(logfile, maxBytes=5_000_000, backupCount=2)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(MemoryHandler(capacity=512, flushLevel=logging.ERROR, target=file_handler))
+
+    # Hand records off to a background writer thread
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(_LocalQueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
     logger.propagate = False
     return logger
\ No newline at end of file
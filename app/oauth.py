@@ -1,21 +1,62 @@
+import math
+import random
 import time
 import threading
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .exceptions import ValidationError
 
 
+# ============================================================
+# Shared HTTP session (keep-alive connection pooling)
+# ============================================================
+
+# One pool per host, reused across requests so Discord calls skip the
+# TCP + TLS handshake. Only idempotent methods are retried by urllib3;
+# 429 is handled by exchange_token_with_backoff itself.
+# Retry-After is ignored here: urllib3 would sleep for whatever the
+# server asks, uncapped, on a request thread. Short backoff only.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers["User-Agent"] = "yt-discord-verifier"
+
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        respect_retry_after_header=False
+    )
+)
+HTTP_SESSION.mount("https://", _adapter)
+HTTP_SESSION.mount("http://", _adapter)
+
+
 # ============================================================
 # Duplicate‑exchange protection
 # ============================================================
 
-# Prevents multiple threads from exchanging the same code at once
-_EXCHANGING_CODES = set()
-_codes_lock = threading.RLock()
+# code -> Event of the thread currently exchanging it.
+# dict.setdefault is atomic, so claiming a code needs no extra lock.
+_INFLIGHT = {}
+_INFLIGHT_WAIT = 10  # seconds a duplicate caller waits for the owner
 
-# Cache: prevents re‑exchanging the same code repeatedly
-_CODE_RESULT_CACHE = {}
+# Cache: prevents re‑exchanging the same code repeatedly.
+# Kept oldest-first so both the size cap and the sweep trim from the front.
+_CODE_RESULT_CACHE = OrderedDict()
 _CODE_CACHE_TTL = 120  # seconds
+_CODE_CACHE_MAX = 4096
+_cache_lock = threading.Lock()
+
+# Background sweeper: evicts results that are never looked up again
+_CODE_CACHE_SWEEP_INTERVAL = 60  # seconds
+_sweeper_started = False
 
 
 # ============================================================
@@ -24,7 +65,12 @@ _CODE_CACHE_TTL = 120  # seconds
 
 def _cache_put(code, value):
     """Store a token exchange result with timestamp."""
-    _CODE_RESULT_CACHE[code] = (value, time.time())
+    with _cache_lock:
+        _CODE_RESULT_CACHE[code] = (value, time.monotonic())
+        _CODE_RESULT_CACHE.move_to_end(code)
+
+        while len(_CODE_RESULT_CACHE) > _CODE_CACHE_MAX:
+            _CODE_RESULT_CACHE.popitem(last=False)
 
 
 def _cache_get(code):
@@ -34,39 +80,116 @@ def _cache_get(code):
         return None
 
     val, ts = item
-    if time.time() - ts > _CODE_CACHE_TTL:
-        _CODE_RESULT_CACHE.pop(code, None)
+    if time.monotonic() - ts > _CODE_CACHE_TTL:
+        with _cache_lock:
+            _CODE_RESULT_CACHE.pop(code, None)
         return None
 
     return val
 
 
+def _sweep_code_cache():
+    """Drop every expired token exchange result."""
+    now = time.monotonic()
+    with _cache_lock:
+        # Oldest first: stop at the first entry that is still fresh
+        while _CODE_RESULT_CACHE:
+            _, ts = next(iter(_CODE_RESULT_CACHE.values()))
+            if now - ts <= _CODE_CACHE_TTL:
+                break
+            _CODE_RESULT_CACHE.popitem(last=False)
+
+
+def _sweeper_loop():
+    while True:
+        time.sleep(_CODE_CACHE_SWEEP_INTERVAL)
+        _sweep_code_cache()
+
+
+def start_code_cache_sweeper():
+    """
+    Start the background cache sweeper (once per process).
+    Without it, codes that are never re-used stay cached forever.
+    """
+    global _sweeper_started
+
+    with _cache_lock:
+        if _sweeper_started:
+            return
+        _sweeper_started = True
+
+    threading.Thread(
+        target=_sweeper_loop,
+        name="oauth-code-cache-sweeper",
+        daemon=True
+    ).start()
+
+
 # ============================================================
 # Token Exchange with Backoff
 # ============================================================
 
+_TOKEN_MAX_ATTEMPTS = 3
+_TOKEN_RETRY_BUDGET = 6  # seconds of total sleeping before giving up on 429s
+
+
+def parse_retry_after(value):
+    """
+    Returns the Retry-After header as seconds (float), or None.
+    Accepts both delta-seconds ("1.5") and HTTP-date forms.
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        # "inf", "nan" and "1e400" parse as floats but are not waits
+        return max(0.0, seconds) if math.isfinite(seconds) else None
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
 def exchange_token_with_backoff(token_url, data, headers, logger=None):
     """
     Exchanges a Discord OAuth code for a token.
-    Handles rate limits (429) gracefully.
+    Retries 429s with jittered backoff; returns a rate_limited
+    result only once the attempts or the wait budget run out.
     """
 
-    try:
-        resp = requests.post(token_url, data=data, headers=headers, timeout=8)
-    except Exception as e:
-        if logger:
-            logger.error(f"Token exchange failed: {e}")
-        raise ValidationError("Failed to contact Discord OAuth server")
+    deadline = time.monotonic() + _TOKEN_RETRY_BUDGET
 
-    # Rate limited
-    if resp.status_code == 429:
-        retry_after = resp.headers.get("Retry-After")
-        wait_s = int(retry_after) if retry_after and retry_after.isdigit() else 2
+    for attempt in range(_TOKEN_MAX_ATTEMPTS):
+        try:
+            resp = HTTP_SESSION.post(token_url, data=data, headers=headers, timeout=8)
+        except Exception as e:
+            if logger:
+                logger.error(f"Token exchange failed: {e}")
+            raise ValidationError("Failed to contact Discord OAuth server")
+
+        if resp.status_code != 429:
+            break
+
+        # Rate limited
+        retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+        if retry_after is None:
+            retry_after = 0.5 * 2 ** attempt
+
+        # Jitter only spreads our own retries; callers get the server's value
+        sleep_s = retry_after + random.uniform(0, retry_after * 0.25)
 
         if logger:
-            logger.warning(f"Rate limited by Discord, retry_after={wait_s}")
+            logger.warning(f"Rate limited by Discord, retry_after={retry_after:.2f}, attempt={attempt + 1}")
+
+        last_try = attempt == _TOKEN_MAX_ATTEMPTS - 1
+        if last_try or time.monotonic() + sleep_s > deadline:
+            return {"error": "rate_limited", "retry_after": math.ceil(retry_after)}
 
-        return {"error": "rate_limited", "retry_after": wait_s}
+        time.sleep(sleep_s)
 
     # Other errors
     if resp.status_code >= 400:
@@ -98,12 +221,17 @@ def safe_token_exchange(token_url, data, headers, logger=None):
             logger.info("Using cached OAuth token result")
         return cached
 
-    # 2. Prevent duplicate simultaneous exchanges
-    with _codes_lock:
-        if code in _EXCHANGING_CODES:
-            raise ValidationError("OAuth code already being exchanged")
+    # 2. Prevent duplicate simultaneous exchanges:
+    #    the first caller owns the code, later ones wait for its result
+    done = threading.Event()
+    owner = _INFLIGHT.setdefault(code, done)
 
-        _EXCHANGING_CODES.add(code)
+    if owner is not done:
+        owner.wait(timeout=_INFLIGHT_WAIT)
+        cached = _cache_get(code)
+        if cached:
+            return cached
+        raise ValidationError("OAuth code already being exchanged")
 
     try:
         # 3. Perform exchange
@@ -115,6 +243,6 @@ def safe_token_exchange(token_url, data, headers, logger=None):
         return result
 
     finally:
-        # Always remove lock
-        with _codes_lock:
-            _EXCHANGING_CODES.discard(code)
\ No newline at end of file
+        # Always release the code and wake any waiters
+        _INFLIGHT.pop(code, None)
+        done.set()
\ No newline at end of file
@@ -1,8 +1,6 @@
-from datetime import datetime
-import json
-
 from .exceptions import AuthorizationError, ValidationError
-from .stores import _OVERRIDES_AUDIT, _store_lock
+from .stores import _OVERRIDES_AUDIT
+from .utils.time_utils import now_iso
 
 
 class Override:
@@ -35,11 +33,9 @@ def resolve_override(app, requester_id: str, requested_role: str, payload: dict)
     # -----------------------------
     # Admin detection
     # -----------------------------
-    is_admin = False
     try:
-        rid = int(str(requester_id))
-        is_admin = rid in cfg.ADMIN_USER_IDS
-    except Exception:
+        is_admin = int(requester_id) in cfg.ADMIN_USER_IDS
+    except (TypeError, ValueError):
         is_admin = False
 
     applied_by_admin = False
@@ -75,24 +71,23 @@ def resolve_override(app, requester_id: str, requested_role: str, payload: dict)
     # -----------------------------
     # Audit logging
     # -----------------------------
-    with _store_lock:
-        _OVERRIDES_AUDIT.append({
-            "timestamp": datetime.utcnow().isoformat(),
-            "requester_id": requester_id,
-            "requested_role": requested_role,
-            "mode": mode,
-            "admin_override": bool(payload.get("admin_override", False)),
-            "applied_by_admin": applied_by_admin,
-            "resolved_duration": resolved_duration
-        })
-
-    logger.info(json.dumps({
+    _OVERRIDES_AUDIT.append({
+        "timestamp": now_iso(),
+        "requester_id": requester_id,
+        "requested_role": requested_role,
+        "mode": mode,
+        "admin_override": bool(payload.get("admin_override", False)),
+        "applied_by_admin": applied_by_admin,
+        "resolved_duration": resolved_duration
+    })
+
+    logger.info("override.resolved", extra={
         "event": "override.resolved",
         "requester_id": requester_id,
         "role": requested_role,
         "duration": resolved_duration,
         "admin": applied_by_admin
-    }))
+    })
 
     return Override(
         resolved_duration=resolved_duration,
@@ -1,4 +1,4 @@
-from flask import Blueprint, request, jsonify, session, render_template, send_from_directory
+from flask import Blueprint, request, jsonify, session, render_template, send_from_directory, current_app as app
 from ..exceptions import AuthorizationError
 from ..stores import list_keys, list_override_audit
 
@@ -8,11 +8,12 @@ bp = Blueprint("admin", __name__, static_folder="static", template_folder="templ
 # -----------------------------
 # Helper: check admin (SESSION-BASED)
 # -----------------------------
-def _is_admin(app, user_id: str) -> bool:
+def _is_admin(app, user_id) -> bool:
+    if isinstance(user_id, int):
+        return user_id in app.cfg.ADMIN_USER_IDS
     try:
-        uid = int(str(user_id))
-        return uid in app.cfg.ADMIN_USER_IDS
-    except Exception:
+        return int(user_id) in app.cfg.ADMIN_USER_IDS
+    except (TypeError, ValueError):
         return False
 
 
@@ -21,8 +22,6 @@ def _is_admin(app, user_id: str) -> bool:
 # -----------------------------
 @bp.route("/admin/keys", methods=["GET"])
 def admin_list_keys():
-    from flask import current_app as app
-
     user = session.get("user")
     if not user:
         raise AuthorizationError("not logged in")
@@ -39,8 +38,6 @@ def admin_list_keys():
 # -----------------------------
 @bp.route("/admin/overrides", methods=["GET"])
 def admin_list_overrides():
-    from flask import current_app as app
-
     user = session.get("user")
     if not user:
         raise AuthorizationError("not logged in")
@@ -1,11 +1,25 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response, jsonify, request
+import hashlib
+import json
 
 bp = Blueprint("health", __name__)
 
+# The landing response never changes, so build it once at import
+_ROOT_BODY = json.dumps({"message": "YT Discord Verifier API is running"}).encode("utf-8")
+_ROOT_ETAG = hashlib.sha1(_ROOT_BODY).hexdigest()
+
 @bp.route("/health", methods=["GET"])
 def health():
     return jsonify({"status": "ok"}), 200
 
 @bp.route("/", methods=["GET"])
 def root():
-    return jsonify({"message": "YT Discord Verifier API is running"}), 200
\ No newline at end of file
+    resp = Response(
+        _ROOT_BODY,
+        mimetype="application/json",
+        headers={"Cache-Control": "public, max-age=300"}
+    )
+    resp.set_etag(_ROOT_ETAG)
+
+    # Returns 304 when the client already has this body
+    return resp.make_conditional(request)
@@ -1,10 +1,9 @@
-from flask import Blueprint, request, jsonify, session, redirect
-from datetime import datetime
+from flask import Blueprint, request, jsonify, session, redirect, current_app as app
 import time
 
 from ..validators import validate_key_payload
 from ..key_manager import quick_key_create, custom_key_create
-from ..stores import _store_lock, _KEYS_STORE, burn_key
+from ..stores import burn_key, list_user_keys
 
 bp = Blueprint("keys", __name__)
 
@@ -20,13 +19,8 @@ def keys_burn():
     if not key_to_burn:
         return jsonify({"ok": False, "message": "No key provided"}), 400
 
-    with _store_lock:
-        key_info = _KEYS_STORE.get(key_to_burn)
-        if not key_info:
-            return jsonify({"ok": False, "message": "Key not found"}), 404
-
-        key_info["status"] = "revoked"
-        _KEYS_STORE[key_to_burn] = key_info
+    if not burn_key(key_to_burn):
+        return jsonify({"ok": False, "message": "Key not found"}), 404
 
     return jsonify({"ok": True, "message": f"Key {key_to_burn} burned"}), 200
 
@@ -36,8 +30,6 @@ def keys_burn():
 # -----------------------------
 @bp.route("/create-key", methods=["GET", "POST"])
 def create_key_route():
-    from flask import current_app as app
-
     # -----------------------------
     # POST: JSON API
     # -----------------------------
@@ -52,7 +44,7 @@ def create_key_route():
         # Prefer logged-in session user
         if not normalized.get("user_id"):
             if "user" in session and session["user"].get("id"):
-                normalized["user_id"] = str(session["user"]["id"])
+                normalized["user_id"] = session["user"]["id"]
             else:
                 normalized["user_id"] = request.headers.get("X-User-Id") or "anonymous"
 
@@ -63,17 +55,8 @@ def create_key_route():
         else:
             created = custom_key_create(app, normalized)
 
-        record = created.get("key", {})
-
-        # Ensure expiry fields exist
-        if not record.get("expires_at"):
-            record["expires_at"] = time.time() + 24 * 3600
-
-        record["expires_at"] = float(record["expires_at"])
-        record["expiry_iso"] = datetime.utcfromtimestamp(record["expires_at"]).isoformat()
-
-        with _store_lock:
-            _KEYS_STORE[record["key_id"]] = record
+        # Already stored with expiry fields by the key manager
+        record = created["key"]
 
         # JSON response
         wants_json = (
@@ -96,22 +79,12 @@ def create_key_route():
     # GET: auto-generate quick key
     # -----------------------------
     if "user" in session and session["user"].get("id"):
-        user_id = str(session["user"]["id"])
+        user_id = session["user"]["id"]
     else:
         user_id = request.args.get("user_id") or "anonymous"
 
     payload = {"mode": "quick", "user_id": user_id}
-    created = quick_key_create(app, payload)
-    record = created.get("key", {})
-
-    if not record.get("expires_at"):
-        record["expires_at"] = time.time() + 24 * 3600
-
-    record["expires_at"] = float(record["expires_at"])
-    record["expiry_iso"] = datetime.utcfromtimestamp(record["expires_at"]).isoformat()
-
-    with _store_lock:
-        _KEYS_STORE[record["key_id"]] = record
+    quick_key_create(app, payload)
 
     # Redirect to public keys page
     return redirect("https://gaming-mods.com/keys.html")
@@ -135,13 +108,10 @@ def keys():
         if not user:
             return jsonify({"ok": False, "message": "Not authenticated"}), 401
 
-        user_id = str(user.get("id"))
+        # Stored as a string by the OAuth callback
+        user_id = user.get("id")
 
-        with _store_lock:
-            user_keys = [
-                k for k in _KEYS_STORE.values()
-                if str(k.get("user_id")) == user_id
-            ]
+        user_keys = list_user_keys(user_id)
 
         formatted = []
         now = time.time()
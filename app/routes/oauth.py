@@ -1,42 +1,58 @@
-import uuid
-import requests
+import re
+import secrets
+from functools import lru_cache
+from urllib.parse import urlencode
 from flask import Blueprint, redirect, request, session, jsonify, current_app as app
 
-from ..oauth import safe_token_exchange   # OAuth utility logic
+from ..oauth import safe_token_exchange, HTTP_SESSION   # OAuth utility logic
 
 bp = Blueprint("oauth", __name__)
 
 OAUTH_STATE_KEY = "discord_oauth_state"
 
+# Static headers for the token exchange POST (requests copies them per call)
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# Discord authorization codes are short URL-safe tokens
+_is_valid_code = re.compile(r"[A-Za-z0-9_\-]{1,512}").fullmatch
+
 
 def _build_redirect_uri():
     # Use the instance config (app.cfg), not the class
     return app.cfg.DISCORD_REDIRECT_URI
 
 
+@lru_cache(maxsize=8)
+def _authorize_prefix(api_base, client_id, redirect_uri):
+    """
+    Authorize URL with every constant parameter encoded once;
+    only the per-request state still has to be appended.
+    """
+    params = {
+        "client_id": client_id,
+        "redirect_uri": redirect_uri,
+        "response_type": "code",
+        "scope": "identify email",
+        "disable_mobile_redirect": "true"   # prevents Discord app hijacking
+    }
+    return f"{api_base}/oauth2/authorize?{urlencode(params)}&state="
+
+
 # -----------------------------
 # 1. Redirect user to Discord
 # -----------------------------
 @bp.route("/login/discord", methods=["GET"])
 def login_discord():
-    state = uuid.uuid4().hex
+    state = secrets.token_urlsafe(24)
     session[OAUTH_STATE_KEY] = state
 
-    params = {
-        "client_id": app.cfg.DISCORD_CLIENT_ID,
-        "redirect_uri": _build_redirect_uri(),
-        "response_type": "code",
-        "scope": "identify email",
-        "state": state,
-        "disable_mobile_redirect": "true"   # prevents Discord app hijacking
-    }
-
-    url = (
-        f"{app.cfg.DISCORD_API_BASE}/oauth2/authorize?"
-        + "&".join([f"{k}={requests.utils.requote_uri(str(v))}" for k, v in params.items()])
+    prefix = _authorize_prefix(
+        app.cfg.DISCORD_API_BASE,
+        app.cfg.DISCORD_CLIENT_ID,
+        _build_redirect_uri()
     )
 
-    return redirect(url)
+    return redirect(prefix + state)
 
 
 # -----------------------------
@@ -52,13 +68,25 @@ def login_discord_callback():
     state = request.args.get("state")
     saved_state = session.pop(OAUTH_STATE_KEY, None)
 
-    if not code or not state or saved_state != state:
+    state_ok = bool(state and saved_state) and secrets.compare_digest(
+        saved_state.encode(), state.encode()
+    )
+
+    if not code or not state_ok:
         return jsonify({
             "ok": False,
             "error": "invalid_state",
             "message": "State mismatch or missing code"
         }), 400
 
+    # Reject malformed codes before spending a Discord round trip
+    if not _is_valid_code(code):
+        return jsonify({
+            "ok": False,
+            "error": "invalid_code",
+            "message": "Malformed OAuth code"
+        }), 400
+
     token_url = f"{app.cfg.DISCORD_API_BASE}/oauth2/token"
     data = {
         "client_id": app.cfg.DISCORD_CLIENT_ID,
@@ -67,10 +95,9 @@ def login_discord_callback():
         "code": code,
         "redirect_uri": _build_redirect_uri(),
     }
-    headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
     try:
-        token_json = safe_token_exchange(token_url, data, headers, logger=app.logger_custom)
+        token_json = safe_token_exchange(token_url, data, _FORM_HEADERS, logger=app.logger_custom)
     except Exception as e:
         return jsonify({
             "ok": False,
@@ -88,7 +115,7 @@ def login_discord_callback():
 
     # Fetch Discord user info
     try:
-        user_resp = requests.get(
+        user_resp = HTTP_SESSION.get(
             f"{app.cfg.DISCORD_API_BASE}/users/@me",
             headers={"Authorization": f"Bearer {access_token}"},
             timeout=8
@@ -126,7 +153,7 @@ def portal_me():
     if not user:
         return jsonify({"ok": False, "message": "Not authenticated"}), 401
 
-    return jsonify({
+    resp = jsonify({
         "ok": True,
         "user_id": user.get("id"),
         "discord_id": user.get("discord_id"),
@@ -136,4 +163,9 @@ def portal_me():
             "discord_id": user.get("discord_id"),
             "username": user.get("username")
         }
-    }), 200
+    })
+
+    # Frontend polls this; let the browser reuse the answer briefly
+    resp.headers["Cache-Control"] = "private, max-age=15"
+    resp.vary.add("Cookie")
+    return resp, 200
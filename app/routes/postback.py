@@ -1,10 +1,7 @@
-from flask import Blueprint, request, jsonify
-from datetime import datetime
-import time
+from flask import Blueprint, request, jsonify, current_app as app
 
 from ..validators import validate_postback_payload
 from ..key_manager import quick_key_create
-from ..stores import _store_lock, _KEYS_STORE
 
 bp = Blueprint("postback", __name__)
 
@@ -15,7 +12,6 @@ def postback_route():
     Webhook: on completed transaction, auto-create a quick key for the user.
     Supports both GET (tracking networks) and POST (JSON webhooks).
     """
-    from flask import current_app as app
 
     # -----------------------------
     # 1. Normalize payload (GET or POST)
@@ -37,7 +33,7 @@ def postback_route():
     # Validate + normalize
     validated = validate_postback_payload(payload)
 
-    app.logger_custom.info({
+    app.logger_custom.info("postback.received", extra={
         "event": "postback.received",
         "tx": validated["transaction_id"],
         "status": validated["status"],
@@ -56,22 +52,11 @@ def postback_route():
                 "admin_override": False
             }
 
-            created = quick_key_create(app, create_payload)
-
-            # Normalize expiry fields
-            record = created.get("key", {})
-            if not record.get("expires_at"):
-                record["expires_at"] = time.time() + 24 * 3600
-
-            record["expires_at"] = float(record["expires_at"])
-            record["expiry_iso"] = datetime.utcfromtimestamp(record["expires_at"]).isoformat()
-
-            # Store key
-            with _store_lock:
-                _KEYS_STORE[record["key_id"]] = record
+            # Stores the key with its expiry fields
+            quick_key_create(app, create_payload)
 
     except Exception as exc:
-        app.logger_custom.warning({
+        app.logger_custom.warning("postback.processing_error", extra={
             "event": "postback.processing_error",
             "tx": validated["transaction_id"],
             "error": repr(exc)
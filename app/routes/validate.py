@@ -1,18 +1,77 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, current_app as app
 from urllib.parse import unquote_plus
-from datetime import datetime
+from functools import lru_cache
+import re
 import time
 
+import orjson
+
+from .. import stores
 from ..stores import (
     _get_key_from_store,
-    burn_key,
-    global_override,
-    admin_overrides,
+    get_cached_validation,
+    cache_validation,
+    queue_burn,
     LEGACY_LIMIT_SECONDS
 )
 
 bp = Blueprint("validate", __name__)
 
+# Bound once so the hot path skips the module attribute lookups
+_time = time.time
+_unquote = unquote_plus
+_gmtime = time.gmtime
+_strftime = time.strftime
+
+
+def _dumps(obj) -> bytes:
+    # Same bytes the app's orjson provider would produce via jsonify
+    return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def _json_response(body: bytes, status: int = 200) -> Response:
+    return Response(body, status=status, mimetype="application/json")
+
+
+def _error_body(message: str) -> bytes:
+    return _dumps({"ok": False, "valid": False, "message": message})
+
+
+# Rejections never vary, so serialize them once at import
+_NO_KEY = (_error_body("No key provided"), 400)
+_UNKNOWN_KEY = (_error_body("Invalid or unknown key"), 400)
+_MALFORMED_EXPIRY = (_error_body("Malformed expiry"), 500)
+_KEY_EXPIRED = (_error_body("Key expired"), 410)
+_SERVER_ERROR = (_error_body("Server error"), 500)
+
+_MANDATORY_FIELDS = ("ok", "valid", "message")
+
+# Every key id is 4-64 of A-Z a-z 0-9 _ - (generated, key_<ms> and
+# admin custom strings); anything else cannot be in the store
+_is_key_shaped = re.compile(r"[A-Za-z0-9_-]{4,64}").fullmatch
+
+# Unfiltered admin-override body; only the expiry values change.
+# %a renders floats via repr(), matching what orjson would emit.
+_ADMIN_OVERRIDE_BODY = (
+    b'{"ok":true,"valid":true,"message":"ADMIN OVERRIDE ACTIVE",'
+    b'"expires_at":%a,"expiry_iso":"%s","expires_in":%d}\n'
+)
+
+
+def _error(const) -> Response:
+    body, status = const
+    return _json_response(body, status)
+
+
+@lru_cache(maxsize=4096)
+def _iso(ts_int: int) -> str:
+    """
+    ISO string for a whole-second UTC timestamp.
+    Keys sharing an expiry second reuse the formatted value.
+    Same text as utcfromtimestamp().isoformat() without building a datetime.
+    """
+    return _strftime("%Y-%m-%dT%H:%M:%S", _gmtime(ts_int))
+
 
 @bp.route("/validate_key", methods=["GET", "POST"])
 @bp.route("/validate_key/<path:key_to_validate>", methods=["GET"])
@@ -22,7 +81,10 @@ def validate_key(key_to_validate=None, did=None):
     Validate a key and return full expiry information.
     Always returns ok, valid, message, and expiry fields.
     """
-    from flask import current_app as app
+
+    # Only the <path:> segment can still be URL-encoded; query args
+    # and JSON bodies arrive already decoded
+    from_path = key_to_validate is not None
 
     try:
         # -----------------------------
@@ -39,85 +101,117 @@ def validate_key(key_to_validate=None, did=None):
             key_to_validate = key_to_validate or request.args.get("key")
 
         if not key_to_validate:
-            return jsonify({"ok": False, "valid": False, "message": "No key provided"}), 400
+            return _error(_NO_KEY)
 
-        key_to_validate = unquote_plus(str(key_to_validate)).strip()
-        now = time.time()
+        key_to_validate = str(key_to_validate)
+        # Nothing to decode without a '%' or '+', so skip unquote_plus
+        if from_path and ("%" in key_to_validate or "+" in key_to_validate):
+            key_to_validate = _unquote(key_to_validate)
+        key_to_validate = key_to_validate.strip()
+        now = _time()
+
+        # Parse ?fields= up front so unrequested values are never built
+        fields_param = request.args.get("fields")
+        requested = dict.fromkeys(f.strip() for f in fields_param.split(",")) if fields_param else None
+        want_iso = requested is None or "expiry_iso" in requested
 
         # -----------------------------
         # Admin override path
         # -----------------------------
-        if global_override or (did and admin_overrides.get(did)):
+        # Read through the module so a rebound global_override is seen
+        if stores.global_override or (did and stores.admin_overrides.get(did)):
             expires_at = float(now + LEGACY_LIMIT_SECONDS)
+
+            if requested is None:
+                body = _ADMIN_OVERRIDE_BODY % (
+                    expires_at,
+                    _iso(int(expires_at)).encode("ascii"),
+                    int(expires_at - now)
+                )
+                return _json_response(body)
+
             response = {
                 "ok": True,
                 "valid": True,
                 "message": "ADMIN OVERRIDE ACTIVE",
                 "expires_at": expires_at,
-                "expiry_iso": datetime.utcfromtimestamp(expires_at).isoformat(),
+                "expiry_iso": _iso(int(expires_at)) if want_iso else None,
                 "expires_in": int(expires_at - now)
             }
 
         else:
             # -----------------------------
-            # Lookup record
+            # Lookup record (recent results are cached briefly)
             # -----------------------------
-            record = _get_key_from_store(key_to_validate)
-            if not record:
-                return jsonify({"ok": False, "valid": False, "message": "Invalid or unknown key"}), 400
+            # Junk never reaches the cache or the store
+            if not _is_key_shaped(key_to_validate):
+                return _error(_UNKNOWN_KEY)
 
-            try:
-                rec_expires_at = float(record.get("expires_at") or 0)
-            except Exception:
-                return jsonify({"ok": False, "valid": False, "message": "Malformed expiry"}), 500
+            record = None
+            cached = get_cached_validation(key_to_validate)
+
+            if cached:
+                valid, rec_expires_at, expiry_iso = cached
+            else:
+                record = _get_key_from_store(key_to_validate)
+                if not record:
+                    return _error(_UNKNOWN_KEY)
+
+                try:
+                    rec_expires_at = float(record.get("expires_at") or 0)
+                except Exception:
+                    return _error(_MALFORMED_EXPIRY)
+
+                status = record.get("status", "active")
+                valid = (status == "active")
+                expiry_iso = None
 
             # -----------------------------
             # Expired key
             # -----------------------------
             if now > rec_expires_at:
-                try:
-                    burn_key(key_to_validate)
-                except Exception:
-                    app.logger_custom.exception("burn_key failed")
+                # Revoke in the background; already-revoked keys need nothing
+                if valid:
+                    queue_burn(key_to_validate)
+
+                return _error(_KEY_EXPIRED)
 
-                return jsonify({"ok": False, "valid": False, "message": "Key expired"}), 410
+            if expiry_iso is None and want_iso:
+                expiry_iso = _iso(int(rec_expires_at))
 
-            status = record.get("status", "active")
-            valid = (status == "active")
+            if record is not None:
+                cache_validation(key_to_validate, record, valid, rec_expires_at, expiry_iso)
 
             response = {
                 "ok": True,
                 "valid": valid,
                 "message": "Key is valid" if valid else "Key is revoked",
                 "expires_at": rec_expires_at,
-                "expiry_iso": datetime.utcfromtimestamp(rec_expires_at).isoformat(),
+                "expiry_iso": expiry_iso,
                 "expires_in": int(rec_expires_at - now)
             }
 
         # -----------------------------
         # Optional field filtering
         # -----------------------------
-        fields_param = request.args.get("fields")
-        if fields_param:
-            requested = {f.strip() for f in fields_param.split(",")}
-            filtered = {k: v for k, v in response.items() if k in requested}
-
-            # Always include ok/valid/message
-            filtered.setdefault("ok", response["ok"])
-            filtered.setdefault("valid", response["valid"])
-            filtered.setdefault("message", response["message"])
+        if requested is not None:
+            # Always include ok/valid/message, then what was asked for
+            filtered = {k: response[k] for k in _MANDATORY_FIELDS}
+            for f in requested:
+                if f in response and f not in filtered:
+                    filtered[f] = response[f]
 
-            return jsonify(filtered), 200
+            return _json_response(_dumps(filtered))
 
         # -----------------------------
         # Default: full response
         # -----------------------------
-        return jsonify(response), 200
+        return _json_response(_dumps(response))
 
     except Exception as e:
-        app.logger_custom.exception(f"Validation failed: {e}")
-        return jsonify({
-            "ok": False,
-            "valid": False,
-            "message": f"Server error: {type(e).__name__} - {str(e)}"
-        }), 500
\ No newline at end of file
+        # Details go to the log only; the client gets a fixed body
+        app.logger_custom.exception("validate.failed", extra={
+            "event": "validate.failed",
+            "exception": repr(e)
+        })
+        return _error(_SERVER_ERROR)
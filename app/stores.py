@@ -1,22 +1,33 @@
 import time
+import queue
 import threading
-from datetime import datetime
+from collections import deque
 from typing import Optional
 
 from .exceptions import ValidationError
+from .utils.time_utils import now_iso
 
 
 # -----------------------------
 # Thread‑safe in‑memory stores
 # -----------------------------
 
+# Serializes writers only. Readers go lock-free: a single dict.get()
+# or list(dict.values()) is atomic under the GIL, so they always see
+# either the old or the new state, never a torn one.
 _store_lock = threading.RLock()
 
 # key_id -> record
 _KEYS_STORE = {}
 
-# audit log for overrides
-_OVERRIDES_AUDIT = []
+# user_id -> {key_id: None}; an insertion-ordered set kept in sync
+# with every store write so per-user listing needs no full scan
+_KEYS_BY_USER = {}
+
+# audit log for overrides (most recent entries only).
+# deque.append is atomic, so writers need no lock.
+_OVERRIDES_AUDIT_MAX = 10000
+_OVERRIDES_AUDIT = deque(maxlen=_OVERRIDES_AUDIT_MAX)
 
 # Global override flags
 global_override = False
@@ -25,44 +36,183 @@ admin_overrides = {}
 # Legacy expiry window
 LEGACY_LIMIT_SECONDS = 3600
 
+# key_id -> (cached_until, valid, expires_at, expiry_iso)
+# Short-lived memo of /validate_key results. Written only under
+# _store_lock, and every store write drops the key's entry, so a
+# burned or replaced key never serves a stale result.
+_VALIDATION_CACHE = {}
+_VALIDATION_CACHE_TTL = 5
+_VALIDATION_CACHE_MAX = 10000
+
 
 # -----------------------------
 # Store Helpers
 # -----------------------------
 
-def burn_key(key_to_burn: str):
+def _write_record(record: dict):
+    """
+    Store a record and keep the per-user index in step with it.
+    Caller holds _store_lock.
+    """
+    key_id = record["key_id"]
+    owner = str(record.get("user_id"))
+
+    # A replaced record may belong to someone else; unlist it for them
+    previous = _KEYS_STORE.get(key_id)
+    if previous is not None:
+        prev_owner = str(previous.get("user_id"))
+        if prev_owner != owner:
+            _KEYS_BY_USER.get(prev_owner, {}).pop(key_id, None)
+
+    _KEYS_STORE[key_id] = record
+    _VALIDATION_CACHE.pop(key_id, None)
+    _KEYS_BY_USER.setdefault(owner, {})[key_id] = None
+
+
+def put_key(record: dict) -> dict:
+    """
+    Insert or replace a key record under its key_id.
+    """
+    with _store_lock:
+        _write_record(record)
+    return record
+
+
+def burn_key(key_to_burn: str) -> bool:
     """
     Mark a key as revoked in the store.
+    Returns False if the key does not exist.
     """
     with _store_lock:
         key_info = _KEYS_STORE.get(key_to_burn)
-        if key_info:
-            key_info["status"] = "revoked"
-            _KEYS_STORE[key_to_burn] = key_info
+        if not key_info:
+            return False
+        key_info["status"] = "revoked"
+        _VALIDATION_CACHE.pop(key_to_burn, None)
+        return True
 
 
 def list_keys() -> list:
     """
-    Return all key records.
+    Return a snapshot of all key records (lock-free).
     """
+    return list(_KEYS_STORE.values())
+
+
+def list_user_keys(user_id: str) -> list:
+    """
+    Return the key records owned by a user, oldest first.
+    """
+    user_id = str(user_id)
     with _store_lock:
-        return list(_KEYS_STORE.values())
+        key_ids = tuple(_KEYS_BY_USER.get(user_id, ()))
+
+    # Re-check ownership: the index only narrows the search
+    records = (_KEYS_STORE.get(k) for k in key_ids)
+    return [r for r in records if r is not None and str(r.get("user_id")) == user_id]
 
 
 def list_override_audit() -> list:
     """
-    Return all override audit entries.
+    Return a snapshot of the override audit entries.
     """
-    with _store_lock:
-        return list(_OVERRIDES_AUDIT)
+    return list(_OVERRIDES_AUDIT)
 
 
 def _get_key_from_store(key_id: str) -> Optional[dict]:
     """
-    Retrieve a key record by ID.
+    Retrieve a key record by ID (lock-free).
+    """
+    return _KEYS_STORE.get(key_id)
+
+
+# -----------------------------
+# Deferred burns
+# -----------------------------
+
+# Expired keys found by /validate_key are revoked here, off the request
+# thread. The 410 never depends on the burn, only on expires_at.
+_BURN_QUEUE = queue.SimpleQueue()
+_burn_worker_started = False
+
+
+def queue_burn(key_to_burn: str):
+    """
+    Schedule a key to be revoked by the background burn worker.
     """
+    _BURN_QUEUE.put(key_to_burn)
+
+
+def _burn_loop(logger):
+    while True:
+        key = _BURN_QUEUE.get()
+        try:
+            burn_key(key)
+        except Exception:
+            # Never let a failed burn (or failed log call) end the worker
+            try:
+                if logger:
+                    logger.exception("burn_key failed", extra={"event": "burn.failed", "key_id": key})
+            except Exception:
+                pass
+
+
+def start_burn_worker(logger=None):
+    """
+    Start the background burn worker (once per process).
+    """
+    global _burn_worker_started
+
     with _store_lock:
-        return _KEYS_STORE.get(key_id)
+        if _burn_worker_started:
+            return
+        _burn_worker_started = True
+
+    threading.Thread(
+        target=_burn_loop,
+        args=(logger,),
+        name="key-burn-worker",
+        daemon=True
+    ).start()
+
+
+# -----------------------------
+# Validation cache
+# -----------------------------
+
+def get_cached_validation(key_id: str) -> Optional[tuple]:
+    """
+    Return (valid, expires_at, expiry_iso) for a recently validated
+    key, or None if there is no fresh entry (lock-free).
+    """
+    entry = _VALIDATION_CACHE.get(key_id)
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return entry[1:]
+
+
+def cache_validation(key_id: str, record: dict, valid: bool, expires_at: float, expiry_iso: str):
+    """
+    Remember a validation result for record, unless the record was
+    burned or replaced since it was read.
+    """
+    with _store_lock:
+        if _KEYS_STORE.get(key_id) is not record:
+            return
+        if (record.get("status", "active") == "active") != valid:
+            return
+
+        _VALIDATION_CACHE.pop(key_id, None)
+        while len(_VALIDATION_CACHE) >= _VALIDATION_CACHE_MAX:
+            # Dicts keep insertion order, so the first key is the oldest
+            del _VALIDATION_CACHE[next(iter(_VALIDATION_CACHE))]
+
+        _VALIDATION_CACHE[key_id] = (
+            time.monotonic() + _VALIDATION_CACHE_TTL,
+            valid,
+            expires_at,
+            expiry_iso
+        )
 
 
 # -----------------------------
@@ -93,7 +243,7 @@ def store_key_record(record: dict, key_id: Optional[str] = None) -> dict:
             record["key_id"] = _generate_key_id()
 
         record.setdefault("status", "active")
-        record["created_at"] = datetime.utcnow().isoformat()
+        record["created_at"] = now_iso()
 
-        _KEYS_STORE[record["key_id"]] = record
-        return _KEYS_STORE[record["key_id"]]
\ No newline at end of file
+        _write_record(record)
+        return record
\ No newline at end of file
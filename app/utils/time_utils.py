@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from flask import g, has_request_context
+
+
+def now_iso() -> str:
+    """
+    UTC "now" as an ISO string, computed once per request.
+    Outside a request (CLI, background threads) it is computed fresh.
+    """
+    if not has_request_context():
+        return datetime.utcnow().isoformat()
+
+    now = g.get("_now_iso")
+    if now is None:
+        now = g._now_iso = datetime.utcnow().isoformat()
+    return now
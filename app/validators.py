@@ -38,6 +38,10 @@ def _ensure_int(value, name, minimum=None, maximum=None):
     return iv
 
 
+# Common spellings listed directly so they match without lower()
+_TRUTHY = frozenset({"1", "true", "yes", "y", "True", "TRUE", "Yes", "YES", "Y"})
+
+
 def _ensure_bool_like(value):
     if isinstance(value, bool):
         return value
@@ -46,7 +50,7 @@ def _ensure_bool_like(value):
         return False
 
     if isinstance(value, str):
-        return value.lower() in ("1", "true", "yes", "y")
+        return value in _TRUTHY or value.lower() in _TRUTHY
 
     return bool(value)
 
@@ -55,6 +59,13 @@ def _ensure_bool_like(value):
 # Payload Validators
 # -----------------------------
 
+# Optional string fields of a key payload: (name, default when absent)
+_KEY_STR_FIELDS = (
+    ("user_id", ""),
+    ("role_id", "default_role"),
+)
+
+
 def validate_key_payload(data: dict) -> dict:
     if not isinstance(data, dict):
         raise ValidationError("payload must be a JSON object")
@@ -65,13 +76,14 @@ def validate_key_payload(data: dict) -> dict:
     if mode not in ("quick", "custom"):
         raise ValidationError("mode must be 'quick' or 'custom'")
 
-    # user_id
-    user_id_raw = data.get("user_id")
-    user_id = _ensure_str(str(user_id_raw), "user_id") if user_id_raw is not None else ""
-
-    # role_id
-    role_id_raw = data.get("role_id")
-    role_id = _ensure_str(str(role_id_raw), "role_id") if role_id_raw is not None else "default_role"
+    # user_id / role_id (ids may arrive as numbers)
+    fields = {}
+    for name, default in _KEY_STR_FIELDS:
+        raw = data.get(name)
+        if raw is None:
+            fields[name] = default
+        else:
+            fields[name] = _ensure_str(raw if isinstance(raw, str) else str(raw), name)
 
     admin_override = _ensure_bool_like(data.get("admin_override", False))
 
@@ -88,8 +100,8 @@ def validate_key_payload(data: dict) -> dict:
 
     return {
         "mode": mode,
-        "user_id": user_id,
-        "role_id": role_id,
+        "user_id": fields["user_id"],
+        "role_id": fields["role_id"],
         "admin_override": admin_override,
         "duration_minutes": duration_minutes
     }
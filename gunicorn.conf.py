@@ -0,0 +1,17 @@
+# Production server settings:  gunicorn -c gunicorn.conf.py run:app
+import os
+
+from app.config import Config
+
+cfg = Config()
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# Handlers mostly wait on Discord, so threads carry the concurrency.
+# Key stores, caches and the override audit live in process memory;
+# a second worker would not see keys created by the first. Stay at one
+# worker (GUNICORN_WORKERS is ignored) until the stores are shared.
+workers = 1
+worker_class = "gthread"
+threads = cfg.GUNICORN_THREADS
+keepalive = 75